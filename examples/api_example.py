@@ -1,21 +1,38 @@
+import asyncio
+import httpx
+import msgspec
+import numpy as np
 import requests
-from datetime import datetime
-from typing import List, Dict
-from pydantic import BaseModel
+from contextvars import ContextVar
+from typing import Any, List, Dict, Optional, Tuple, Type
 from llmrepo.tools import BaseTool, BaseToolbox, ToolParameter
 
-class CurrentWeather(BaseModel):
+class CurrentWeather(msgspec.Struct, frozen=True):
     temperature_2m: float
     wind_speed_10m: float
     time: str
 
-class HourlyWeather(BaseModel):
-    time: List[str]
-    temperature_2m: List[float]
-    relative_humidity_2m: List[float]
-    wind_speed_10m: List[float]
+# hourly columns are stored as contiguous arrays rather than lists of objects,
+# using the narrowest dtype that holds the API's precision (0.1°C, whole %)
+_HOURLY_DTYPES = {
+    "time": "datetime64[s]",
+    "temperature_2m": np.float32,
+    "relative_humidity_2m": np.uint8,
+    "wind_speed_10m": np.float32,
+}
 
-class WeatherResponse(BaseModel):
+class HourlyWeather(msgspec.Struct, frozen=True):
+    time: np.ndarray
+    temperature_2m: np.ndarray
+    relative_humidity_2m: np.ndarray
+    wind_speed_10m: np.ndarray
+
+    def __post_init__(self):
+        for name, dtype in _HOURLY_DTYPES.items():
+            column = getattr(self, name).astype(dtype, copy=False)
+            msgspec.structs.force_setattr(self, name, column)
+
+class WeatherResponse(msgspec.Struct, frozen=True):
     latitude: float
     longitude: float
     timezone: str
@@ -25,6 +42,22 @@ class WeatherResponse(BaseModel):
     hourly: HourlyWeather
 
 
+def _decode_array(type: Type, obj: Any) -> Any:
+    if type is np.ndarray:
+        return np.asarray(obj)
+    raise NotImplementedError(f"Cannot decode {type}")
+
+
+_DECODER = msgspec.json.Decoder(WeatherResponse, dec_hook=_decode_array)
+
+# reuse connections across calls instead of a new TCP+TLS handshake per request.
+# httpx's async client binds its connection pool to the event loop it first runs
+# on, so async clients are created per call instead, or shared by a batch of
+# calls from ainvoke_many through _BATCH_CLIENT.
+_SESSION = requests.Session()
+_BATCH_CLIENT: ContextVar[Optional[httpx.AsyncClient]] = ContextVar("_BATCH_CLIENT", default=None)
+
+
 class WeatherTool(BaseTool):
     """Tool to get weather forecast using Open-Meteo API."""
     name: str = "get_weather"
@@ -45,22 +78,52 @@ class WeatherTool(BaseTool):
         )
     }
     
-    def invoke(self, lat: float, lon: float) -> WeatherResponse:
+    def _params(self, lat: float, lon: float) -> Dict[str, Any]:
         # Store coordinates in shared context
         self.context.set('last_lat', lat, force_shared=True)
         self.context.set('last_lon', lon, force_shared=True)
         
-        params = {
+        return {
             'latitude': lat,
             'longitude': lon,
             'current': 'temperature_2m,wind_speed_10m',
             'hourly': 'temperature_2m,relative_humidity_2m,wind_speed_10m',
             'timezone': 'auto'
         }
-        
-        result = requests.get(self.endpoint, params=params)
+
+    def invoke(self, lat: float, lon: float) -> WeatherResponse:
+        result = _SESSION.get(self.endpoint, params=self._params(lat, lon), timeout=10)
+        result.raise_for_status()
+        return _DECODER.decode(result.content)
+
+    async def _fetch(self, client: httpx.AsyncClient, lat: float, lon: float) -> WeatherResponse:
+        result = await client.get(self.endpoint, params=self._params(lat, lon))
         result.raise_for_status()
-        return WeatherResponse(**result.json())
+        return _DECODER.decode(result.content)
+
+    async def ainvoke(self, lat: float, lon: float) -> WeatherResponse:
+        client = _BATCH_CLIENT.get()
+        if client is not None:
+            return await self._fetch(client, lat, lon)
+        async with httpx.AsyncClient(timeout=10) as client:
+            return await self._fetch(client, lat, lon)
+
+    async def ainvoke_many(self, coords: List[Tuple[float, float]]) -> List[WeatherResponse]:
+        """Fetches forecasts for many coordinates concurrently."""
+        # bound the number of requests in flight to respect the API's rate limit
+        semaphore = asyncio.Semaphore(32)
+
+        async def fetch(lat: float, lon: float) -> WeatherResponse:
+            async with semaphore:
+                return await self.ainvoke(lat=lat, lon=lon)
+
+        # the requests of a batch share one client, and so its connections
+        async with httpx.AsyncClient(timeout=10) as client:
+            token = _BATCH_CLIENT.set(client)
+            try:
+                return await asyncio.gather(*(fetch(lat, lon) for lat, lon in coords))
+            finally:
+                _BATCH_CLIENT.reset(token)
 
 class WeatherToolbox(BaseToolbox):
     """Toolbox for weather operations using Open-Meteo API."""
@@ -89,12 +152,12 @@ if __name__ == "__main__":
         
         # Print hourly forecast for the next 24 hours
         print("\nHourly Forecast (next 24 hours):")
-        for i in range(24):
-            time = datetime.fromisoformat(response.hourly.time[i])
+        hourly = response.hourly
+        for i, time in enumerate(hourly.time[:24].tolist()):
             print(f"\n{time.strftime('%I:%M %p')}:")
-            print(f"Temperature: {response.hourly.temperature_2m[i]}°C")
-            print(f"Humidity: {response.hourly.relative_humidity_2m[i]}%")
-            print(f"Wind Speed: {response.hourly.wind_speed_10m[i]} m/s")
+            print(f"Temperature: {hourly.temperature_2m[i]:.1f}°C")
+            print(f"Humidity: {hourly.relative_humidity_2m[i]}%")
+            print(f"Wind Speed: {hourly.wind_speed_10m[i]:.1f} m/s")
             
     except ValueError as e:
         print(f"\nError: {str(e)}")
@@ -1,6 +1,75 @@
+import math
+import numpy as np
 from typing import Any, Callable, Dict, List
 from llmrepo.tools import BaseTool, BaseToolbox, ToolParameter
 
+try:
+    from numba import njit
+    from numba.core.errors import NumbaError
+except ImportError:  # numba is optional, the NumPy operations are used instead
+    njit = None
+    NumbaError = TypeError
+
+
+if njit is not None:
+    @njit(cache=True)
+    def _sum(a):
+        s = 0.0
+        for i in range(a.shape[0]):
+            s += a[i]
+        return s
+
+    @njit(cache=True)
+    def _prod(a):
+        p = 1.0
+        for i in range(a.shape[0]):
+            p *= a[i]
+        return p
+
+    @njit(cache=True)
+    def _mean(a):
+        return _sum(a) / a.shape[0]
+
+    # compiled kernels for the operations that reduce over a list of numbers
+    _KERNELS = {"add": _sum, "multiply": _prod, "average": _mean}
+else:
+    _KERNELS = {}
+
+
+def _all_ints(numbers: List[Any]) -> bool:
+    return all(isinstance(n, int) for n in numbers)
+
+
+# integers are summed and multiplied exactly in Python, since float64 loses
+# precision past 2**53; only inputs with floats go through NumPy
+def _add(numbers: List[Any]) -> Any:
+    if _all_ints(numbers):
+        return sum(numbers)
+    return float(np.add.reduce(np.asarray(numbers, dtype=np.float64)))
+
+
+def _multiply(numbers: List[Any]) -> Any:
+    if _all_ints(numbers):
+        return math.prod(numbers)
+    return float(np.prod(np.asarray(numbers, dtype=np.float64)))
+
+
+def _average(numbers: List[Any]) -> float:
+    if not numbers:
+        # np.mean would warn and return nan for an empty list
+        raise ZeroDivisionError("division by zero")
+    return float(np.mean(np.asarray(numbers, dtype=np.float64)))
+
+
+def _call_kernel(kernel: Callable, numbers: List[Any]) -> float:
+    array = np.ascontiguousarray(numbers, dtype=np.float64)
+    if array.ndim != 1:
+        # the kernels are compiled for flat arrays only, and numba would
+        # otherwise try (and fail) to compile them anew on every call
+        raise ValueError("Expected a flat list of numbers")
+    return kernel(array)
+
+
 class MathTool(BaseTool):
     """A tool for performing basic mathematical operations."""
     
@@ -15,11 +84,25 @@ class MathTool(BaseTool):
             description=description,
             parameters=parameters
         )
+        self._fallback = operation
         self._operation = operation
+
+        kernel = _KERNELS.get(name)
+        if kernel is not None:
+            self._operation = lambda numbers: (
+                operation(numbers) if _all_ints(numbers) else _call_kernel(kernel, numbers)
+            )
         
     def invoke(self, **kwargs) -> Any:
         try:
-            return self._operation(**kwargs)
+            try:
+                return self._operation(**kwargs)
+            except (TypeError, ValueError, NumbaError):
+                # the compiled kernels only accept flat numeric input,
+                # so anything else goes through the original operation
+                if self._operation is self._fallback:
+                    raise
+                return self._fallback(**kwargs)
         except Exception as e:
             return f"Error performing {self.name}: {str(e)}"
 
@@ -28,28 +111,28 @@ class MathToolBox(BaseToolbox):
     add_tool = MathTool(
         name="add",
         description="Add two or more numbers together",
-        operation=lambda numbers: sum(numbers),
+        operation=_add,
         parameters={"numbers": ToolParameter(name="numbers", type="list", description="List of numbers to add together", required=True)}
     )
     
     multiply_tool = MathTool(
         name="multiply",
         description="Multiply a list of numbers together",
-        operation=lambda numbers: eval('*'.join(map(str, numbers))),
+        operation=_multiply,
         parameters={"numbers": ToolParameter(name="numbers", type="list", description="List of numbers to multiply together", required=True)}
     )
 
     average_tool = MathTool(
         name="average",
         description="Calculate the average (mean) of a list of numbers",
-        operation=lambda numbers: sum(numbers) / len(numbers),
+        operation=_average,
         parameters={"numbers": ToolParameter(name="numbers", type="list", description="List of numbers to calculate the average of", required=True)}
     )
 
     factorial_tool = MathTool(
         name="factorial",
         description="Calculate the factorial of a number",
-        operation=lambda n: eval('*'.join(map(str, range(1, n + 1)))),
+        operation=lambda n: math.factorial(n),
         parameters={"n": ToolParameter(name="n", type="int", description="Number to calculate factorial of", required=True)}
     )
 
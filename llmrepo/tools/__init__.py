@@ -1,10 +1,18 @@
 import asyncio
+import functools
 import logging
+import sys
+import weakref
 from enum import Enum
-from collections import defaultdict
+from collections import ChainMap
 from abc import ABC, abstractmethod
-from pydantic import BaseModel, Field
-from typing import Any, Callable, Dict, List, Optional, Union, Literal
+from pydantic import BaseModel, Field, PrivateAttr, field_validator
+from typing import Any, Awaitable, Callable, ClassVar, Dict, List, Optional, Tuple, TypeVar, Union, Literal
+
+try:
+    import uvloop
+except ImportError:  # uvloop is optional, asyncio's own event loop is used instead
+    uvloop = None
 
 
 
@@ -17,6 +25,9 @@ class ToolEvent(str, Enum):
     ERROR = "error"
 
 
+_T = TypeVar("_T")
+
+
 # Create a type for valid event strings
 ToolEventType = Literal[
     "invoke:before",
@@ -27,6 +38,19 @@ ToolEventType = Literal[
 ]
 
 
+# mapping of parameter type strings to the Python types they validate against
+_TYPE_MAP: Dict[str, type] = {
+    "str": str,
+    "int": int,
+    "float": float,
+    "bool": bool,
+    "list": list,
+    "dict": dict,
+    "tuple": tuple,
+    "set": set
+}
+
+
 class ToolParameter(BaseModel):
     """
     This model represents a parameter for a tool. Parameters
@@ -46,6 +70,40 @@ class ToolParameter(BaseModel):
     required: bool = Field(default=True, description="Whether the parameter is required")
     default: Optional[Any] = Field(default=None, description="The default value of the parameter")
 
+    # the Python type `type` names, resolved once rather than on every call
+    _pytype: Optional[type] = PrivateAttr(default=None)
+
+    # builds a fresh copy of a mutable default from a frozen snapshot of it
+    _default_factory: Optional[Callable[[], Any]] = PrivateAttr(default=None)
+
+    # parameters are immutable once created, since the validators built
+    # from them are cached and shared between tools
+    model_config = {"frozen": True}
+
+    @field_validator("name")
+    @classmethod
+    def _intern_name(cls, value: str) -> str:
+        """Interns the name, so it matches kwargs keys by identity."""
+        return sys.intern(value)
+
+    @field_validator("type")
+    @classmethod
+    def _normalize_type(cls, value: str) -> str:
+        """Lowercases the type once, so lookups don't have to on every call."""
+        return value.lower()
+
+    def model_post_init(self, __context: Any) -> None:
+        self._pytype = _TYPE_MAP.get(self.type)
+
+        # list, set and dict defaults are snapshotted as tuples and turned
+        # back into a fresh container for every call that uses them, so
+        # calls never share (and mutate) the same default object
+        default_type = type(self.default)
+        if default_type is dict:
+            self._default_factory = functools.partial(dict, tuple(self.default.items()))
+        elif default_type is list or default_type is set:
+            self._default_factory = functools.partial(default_type, tuple(self.default))
+
 
 class ToolMetadata(BaseModel):
     """
@@ -64,6 +122,10 @@ class ToolMetadata(BaseModel):
     )
 
 
+# sentinel for context lookups, since None is a valid context value
+_MISSING = object()
+
+
 class ToolContext:
     """
     A class to manage tool context with support for both internal and shared state.
@@ -72,6 +134,7 @@ class ToolContext:
         _internal_context: Dictionary storing tool-specific context
         _shared_context: Dictionary storing context shared across tools
     """
+    __slots__ = ("_internal_context", "_shared_context")
     
     def __init__(self, initial_context: Optional[Dict[str, Any]] = None):
         """
@@ -84,14 +147,15 @@ class ToolContext:
         self._shared_context: Dict[str, Any] = {}
     
     @property
-    def context(self) -> Dict[str, Any]:
+    def context(self) -> ChainMap:
         """
         Gets a combined view of internal and shared context.
         Internal context takes precedence over shared context.
+
+        The view is live rather than a copy, so writes to it go
+        to the internal context.
         """
-        combined = self._shared_context.copy()
-        combined.update(self._internal_context)
-        return combined
+        return ChainMap(self._internal_context, self._shared_context)
     
     @context.setter
     def context(self, value: Dict[str, Any]) -> None:
@@ -108,9 +172,10 @@ class ToolContext:
             key: The context key to look up
             default: Value to return if key is not found in either context
         """
-        if key in self._internal_context:
-            return self._internal_context[key]
-        return self._shared_context.get(key, default)
+        value = self._internal_context.get(key, _MISSING)
+        if value is _MISSING:
+            return self._shared_context.get(key, default)
+        return value
     
     def set(self, key: str, value: Any, force_shared: bool = False) -> None:
         """
@@ -122,25 +187,27 @@ class ToolContext:
             value: The value to set
             force_shared: If True, always set in shared context
         """
+        # log messages are formatted lazily, since set() is on tools' hot paths
         if force_shared:
             self._shared_context[key] = value
         elif key in self._shared_context:
-            logging.debug(f"Updating shared context key: {key}")
+            logging.debug("Updating shared context key: %s", key)
             self._shared_context[key] = value
         elif key in self._internal_context:
-            logging.debug(f"Updating internal context key: {key}")
+            logging.debug("Updating internal context key: %s", key)
             self._internal_context[key] = value
         else:
-            logging.debug(f"Creating new internal context key: {key}")
+            logging.debug("Creating new internal context key: %s", key)
             self._internal_context[key] = value
     
     def __getitem__(self, key: str) -> Any:
         """Dictionary-style access to context values."""
-        if key in self._internal_context:
-            return self._internal_context[key]
-        if key in self._shared_context:
-            return self._shared_context[key]
-        raise KeyError(key)
+        value = self._internal_context.get(key, _MISSING)
+        if value is _MISSING:
+            value = self._shared_context.get(key, _MISSING)
+            if value is _MISSING:
+                raise KeyError(key)
+        return value
     
     def __setitem__(self, key: str, value: Any) -> None:
         """Dictionary-style setting of context values."""
@@ -151,6 +218,379 @@ class ToolContext:
         return key in self._internal_context or key in self._shared_context
 
 
+# how many generated validators are kept for reuse; each distinct parameter
+# schema gets one, and dynamically created tools can have many schemas
+_VALIDATOR_CACHE_SIZE = 256
+
+# how a parameter's default is filled in: not at all, as is, or as a fresh
+# copy built by the parameter's default factory
+_NO_DEFAULT, _DEFAULT_VALUE, _DEFAULT_COPY = range(3)
+
+
+def _default_kind(param_spec: ToolParameter) -> int:
+    """
+    Returns how the validator fills in the default of a parameter.
+
+    Args:
+        param_spec: The parameter specification
+    """
+    if param_spec.default is None:
+        return _NO_DEFAULT
+    if param_spec._default_factory is not None:
+        return _DEFAULT_COPY
+    return _DEFAULT_VALUE
+
+
+def _parameter_schema(
+    parameters: Dict[str, ToolParameter]
+) -> Tuple[Tuple[Tuple[str, ...], Tuple[str, ...], Tuple[Optional[type], ...], int, Tuple[int, ...]], Tuple[Any, ...]]:
+    """
+    Flattens parameter specifications into parallel tuples of names, type
+    strings, resolved types and default kinds, plus a bitmask with bit i
+    set if parameter i is required. The flat form is what validators are
+    keyed by and generated from. The defaults themselves are returned
+    separately, since they are bound to each tool rather than to the
+    shared validator.
+
+    Args:
+        parameters: The parameter specifications to flatten
+
+    Returns:
+        The parameter schema and the tuple of parameter defaults.
+    """
+    # interned names are shared with the keyword names of calls, so that
+    # dict and set lookups during validation hit on identity
+    names = tuple(map(sys.intern, parameters))
+    type_names = tuple(param_spec.type for param_spec in parameters.values())
+    types = tuple(param_spec._pytype for param_spec in parameters.values())
+    default_kinds = tuple(map(_default_kind, parameters.values()))
+    # mutable defaults are bound as their factories, which are called for
+    # a fresh copy whenever the default is used
+    defaults = tuple(
+        param_spec._default_factory or param_spec.default
+        for param_spec in parameters.values()
+    )
+    required_mask = 0
+    for i, param_spec in enumerate(parameters.values()):
+        if param_spec.required:
+            required_mask |= 1 << i
+    return (names, type_names, types, required_mask, default_kinds), defaults
+
+
+def _missing_parameter(names: Tuple[str, ...], required_mask: int, kwargs: Dict[str, Any]) -> str:
+    """
+    Returns the name of the first required parameter missing from kwargs.
+
+    Args:
+        names: The parameter names, in declaration order
+        required_mask: Bitmask with bit i set if parameter i must be passed
+        kwargs: The invocation parameters
+    """
+    present_mask = 0
+    for i, name in enumerate(names):
+        if name in kwargs:
+            present_mask |= 1 << i
+    missing = required_mask & ~present_mask
+    return names[(missing & -missing).bit_length() - 1]
+
+
+@functools.lru_cache(maxsize=_VALIDATOR_CACHE_SIZE)
+def _build_validator(
+    schema: Tuple[Tuple[str, ...], Tuple[str, ...], Tuple[Optional[type], ...], int, Tuple[int, ...]]
+) -> Callable[[Tuple[Any, ...], Dict[str, Any]], None]:
+    """
+    Builds a function that validates invocation parameters against the
+    given parameter schema. The function is generated as straight-line
+    code with one block per parameter, so validating an invocation
+    doesn't loop over the specifications or resolve their type strings.
+
+    The generated function takes the tool's parameter defaults as its
+    first argument, so tools with the same schema but different defaults
+    can share it. It raises ValueError if unexpected or missing required
+    parameters are found, and TypeError if parameter types don't match
+    the expected types.
+
+    Validators are cached by schema, so tools with the same parameter
+    schema share the generated code.
+
+    Args:
+        schema: The flattened parameter specifications to validate against
+    """
+    names, type_names, types, required_mask, default_kinds = schema
+    # required parameters without a default must be passed, which is checked
+    # up front with a single subset test rather than one lookup per parameter
+    must_pass_mask = 0
+    for i, kind in enumerate(default_kinds):
+        if required_mask >> i & 1 and kind == _NO_DEFAULT:
+            must_pass_mask |= 1 << i
+    must_pass = frozenset(
+        name for i, name in enumerate(names) if must_pass_mask >> i & 1
+    )
+    namespace: Dict[str, Any] = {
+        "_allowed": frozenset(names),
+        "_pnames": names,
+        "_must_pass": must_pass,
+        "_must_pass_mask": must_pass_mask,
+        "_missing_parameter": _missing_parameter,
+        "_missing": object(),
+    }
+    lines = [
+        "def _validate(_defaults, kwargs):",
+        "    if not kwargs:",
+        "        return",
+        "    unexpected_params = kwargs.keys() - _allowed",
+        "    if unexpected_params:",
+        "        raise ValueError(f'Unexpected parameters: {unexpected_params}')",
+    ]
+    if must_pass:
+        lines += [
+            "    if not _must_pass <= kwargs.keys():",
+            "        raise ValueError('Missing required parameter: '",
+            "                         + _missing_parameter(_pnames, _must_pass_mask, kwargs))",
+        ]
+
+    for i, (param_name, type_name, expected_type, kind) in enumerate(
+        zip(names, type_names, types, default_kinds)
+    ):
+        namespace[f"_type_{i}"] = expected_type
+        name = repr(param_name)
+        if kind == _DEFAULT_COPY:
+            default_value = f"_defaults[{i}]()"
+        else:
+            default_value = f"_defaults[{i}]"
+        type_error = f"Parameter '{param_name}' must be of type {type_name}, got "
+
+        if must_pass_mask >> i & 1:
+            lines += [
+                f"    value = kwargs[{name}]",
+                "    if value is None:",
+                f"        raise TypeError({repr(type_error + 'NoneType')})",
+            ]
+        elif required_mask >> i & 1:
+            lines += [
+                f"    value = kwargs.get({name}, _missing)",
+                "    if value is _missing:",
+                f"        value = kwargs[{name}] = {default_value}",
+                "    if value is None:",
+                f"        raise TypeError({repr(type_error + 'NoneType')})",
+            ]
+        else:
+            lines += [
+                f"    value = kwargs.get({name})",
+                "    if value is None:",
+                f"        if {name} in kwargs:",
+                f"            kwargs[{name}] = {default_value}",
+            ]
+
+        # values that are present and not None must match the expected type
+        if expected_type is None:
+            lines += [
+                "    else:",
+                f"        raise ValueError({repr(f'Unsupported parameter type: {type_name}')})",
+            ]
+        elif expected_type is int:
+            # bool subclasses int, but True is not an integer argument
+            lines += [
+                "    elif isinstance(value, bool) or not isinstance(value, int):",
+                f"        raise TypeError({repr(type_error)} + type(value).__name__)",
+            ]
+        else:
+            lines += [
+                f"    elif not isinstance(value, _type_{i}):",
+                f"        raise TypeError({repr(type_error)} + type(value).__name__)",
+            ]
+
+    source = "\n".join(lines)
+    exec(compile(source, "<validator>", "exec"), namespace)
+    return namespace["_validate"]
+
+
+def _get_validator(parameters: Dict[str, ToolParameter]) -> Callable[[Dict[str, Any]], None]:
+    """
+    Returns the validator for the given parameter specifications. The
+    generated code is shared by all tools with the same parameter schema
+    and built only once; each tool gets it bound to its own defaults.
+
+    Args:
+        parameters: The parameter specifications to validate against
+    """
+    schema, defaults = _parameter_schema(parameters)
+    return functools.partial(_build_validator(schema), defaults)
+
+
+# callbacks registered for an event, each paired with whether it is a coroutine
+# function. Tuples are rebuilt on registration, which is rare, so that
+# triggering an event iterates a fixed tuple.
+_Callbacks = Tuple[Tuple[Callable, bool], ...]
+
+
+def _event_callbacks(private: Dict[str, Any], event: ToolEvent) -> _Callbacks:
+    """
+    Returns the callbacks registered for an event on a tool, followed by
+    those registered on each live toolbox the tool belongs to.
+
+    Args:
+        private: The tool's private attributes
+        event: The event to get the callbacks for
+    """
+    callbacks = private["_hooks"][event]
+    for toolbox_ref in private["_toolboxes"]:
+        toolbox = toolbox_ref()
+        if toolbox is not None:
+            callbacks += toolbox._hooks[event]
+    return callbacks
+
+
+def _register_hook(
+    hooks: Dict[ToolEvent, _Callbacks],
+    event: Union[ToolEvent, ToolEventType],
+    callback: Callable
+) -> None:
+    """
+    Registers a callback function for a specific event in a hooks dictionary.
+
+    Args:
+        hooks: The dictionary of event hooks to register the callback in
+        event: The event to hook into, either as ToolEvent enum or string
+        callback: The function to call when the event occurs
+
+    Raises:
+        ValueError: If the event is not a valid ToolEvent
+    """
+    if isinstance(event, str):
+        try:
+            event = ToolEvent(event)
+        except ValueError:
+            valid_events = ", ".join(e.value for e in ToolEvent)
+            raise ValueError(
+                f"Invalid event '{event}'. Valid events are: {valid_events}"
+            )
+    
+    # resolve whether the callback needs awaiting once, not on every event
+    hooks[event] += ((callback, asyncio.iscoroutinefunction(callback)),)
+
+
+def _wrap_invoke(func: Callable) -> Callable:
+    """
+    Wraps a tool's invoke method to validate its parameters and trigger
+    the synchronous lifecycle events.
+
+    Args:
+        func: The invoke method to wrap
+    """
+    # events are bound once as closure variables, so triggering them is a
+    # cell load rather than an attribute lookup on the enum class
+    before_invoke = ToolEvent.BEFORE_INVOKE
+    after_invoke = ToolEvent.AFTER_INVOKE
+    error_event = ToolEvent.ERROR
+
+    @functools.wraps(func)
+    def invoke(self, *args, **kwargs):
+        # only the outermost invoke triggers events, so a tool calling
+        # super().invoke() does not trigger them a second time
+        if type(self).invoke is not invoke:
+            return func(self, *args, **kwargs)
+
+        # private attributes are read from pydantic's storage directly,
+        # since self._name goes through BaseModel.__getattr__ every time
+        private = self.__pydantic_private__
+
+        # most tools have no callbacks at all, so skip the event bookkeeping
+        if not private["_has_handlers"]:
+            private["_validator"](kwargs)
+            return func(self, *args, **kwargs)
+
+        for callback, _ in _event_callbacks(private, before_invoke):
+            callback(self, args=args, kwargs=kwargs)
+        
+        try:
+            private["_validator"](kwargs)
+            result = func(self, *args, **kwargs)
+            
+            for callback, _ in _event_callbacks(private, after_invoke):
+                callback(self, result=result, args=args, kwargs=kwargs)
+            
+            return result
+        except Exception as e:
+            for callback, _ in _event_callbacks(private, error_event):
+                callback(self, error=e, args=args, kwargs=kwargs)
+            raise
+    return invoke
+
+
+def _wrap_ainvoke(func: Callable) -> Callable:
+    """
+    Wraps a tool's ainvoke method to validate its parameters and trigger
+    the asynchronous lifecycle events.
+
+    Args:
+        func: The ainvoke method to wrap
+    """
+    before_ainvoke = ToolEvent.BEFORE_AINVOKE
+    after_ainvoke = ToolEvent.AFTER_AINVOKE
+    error_event = ToolEvent.ERROR
+
+    @functools.wraps(func)
+    async def ainvoke(self, *args, **kwargs):
+        # only the outermost ainvoke triggers events, so a tool awaiting
+        # super().ainvoke() does not trigger them a second time
+        if type(self).ainvoke is not ainvoke:
+            return await func(self, *args, **kwargs)
+
+        private = self.__pydantic_private__
+        if not private["_has_handlers"]:
+            private["_validator"](kwargs)
+            return await func(self, *args, **kwargs)
+
+        # only await when a coroutine callback is actually pending
+        pending = self._trigger_event_async(
+            before_ainvoke,
+            {"args": args, "kwargs": kwargs}
+        )
+        if pending is not None:
+            await pending
+        try:
+            private["_validator"](kwargs)
+            result = await func(self, *args, **kwargs)
+            
+            pending = self._trigger_event_async(
+                after_ainvoke,
+                {"result": result, "args": args, "kwargs": kwargs}
+            )
+            if pending is not None:
+                await pending
+            return result
+        except Exception as e:
+            pending = self._trigger_event_async(
+                error_event,
+                {"error": e, "args": args, "kwargs": kwargs}
+            )
+            if pending is not None:
+                await pending
+            raise
+    return ainvoke
+
+
+def _copy_openai_tool(openai_tool: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Copies a tool's cached OpenAI format down to its parameter specifications,
+    which is every level a caller would reasonably modify.
+
+    Args:
+        openai_tool: The tool's metadata in OpenAI's format
+    """
+    function = openai_tool["function"]
+    return {
+        **openai_tool,
+        "function": {
+            **function,
+            "parameters": {
+                name: dict(param) for name, param in function["parameters"].items()
+            },
+        },
+    }
+
+
 class BaseTool(ToolMetadata, ABC):
     """
     An abstract base class that represents a tool that can be used by an LLM.
@@ -158,12 +598,34 @@ class BaseTool(ToolMetadata, ABC):
     async implementation (ainvoke). Each tool must specify its name, description,
     and expected parameters.
 
+    Tools with a numeric core can set `jit = True` and implement it as a
+    `kernel` staticmethod taking and returning scalars or arrays. When numba
+    is installed, the kernel is compiled with `numba.njit(cache=True)`,
+    eagerly at class definition if `jit_signature` is given (e.g.
+    "int64(int64)"). Otherwise the kernel runs as plain Python.
+
     Attributes:
         context: ToolContext instance managing internal and shared state
-        _hooks: Internal dictionary of event hooks and their callbacks.
+        jit: Whether to compile the tool's kernel with numba
+        jit_signature: Optional numba signature to compile the kernel eagerly
+        _hooks: Internal dictionary of event hooks and their callbacks, each
+            paired with whether the callback is a coroutine function.
+        _toolboxes: Weak references to the toolboxes the tool belongs to,
+            whose hooks are triggered after the tool's own hooks.
+        _has_handlers: Whether any callback is registered for the tool, either
+            on the tool itself or on one of its toolboxes.
+        _validator: Validates invocation parameters against the tool's parameters.
+        _openai_cache: The metadata the OpenAI format was last built from,
+            paired with that format.
     """
     context: ToolContext = Field(default_factory=ToolContext)
-    _hooks: Dict[ToolEvent, List[Callable]] = defaultdict(list)
+    jit: ClassVar[bool] = False
+    jit_signature: ClassVar[Optional[str]] = None
+    _hooks: Dict[ToolEvent, _Callbacks]
+    _toolboxes: Tuple["weakref.ReferenceType[BaseToolbox]", ...]
+    _has_handlers: bool
+    _validator: Callable[[Dict[str, Any]], None]
+    _openai_cache: Optional[Tuple[Tuple[str, str, Dict[str, ToolParameter]], Dict[str, Any]]]
 
     model_config = {"arbitrary_types_allowed": True}
 
@@ -175,6 +637,19 @@ class BaseTool(ToolMetadata, ABC):
         if 'context' in kwargs:
             self.context = ToolContext(kwargs.get('context'))
 
+    def model_post_init(self, __context: Any) -> None:
+        """
+        Sets up the tool's private state once its fields are validated.
+        The private attributes are written in a single update, rather than
+        through pydantic's __setattr__ one at a time.
+        """
+        self.__pydantic_private__.update(
+            _hooks={event: () for event in ToolEvent},
+            _toolboxes=(),
+            _has_handlers=False,
+            _validator=_get_validator(self.parameters),
+            _openai_cache=None,
+        )
 
     def on(self, event: Union[ToolEvent, ToolEventType], callback: Callable) -> None:
         """
@@ -187,170 +662,199 @@ class BaseTool(ToolMetadata, ABC):
         Raises:
             ValueError: If the event is not a valid ToolEvent
         """
-        if isinstance(event, str):
-            try:
-                event = ToolEvent(event)
-            except ValueError:
-                valid_events = ", ".join(e.value for e in ToolEvent)
-                raise ValueError(
-                    f"Invalid event '{event}'. Valid events are: {valid_events}"
-                )
-        
-        self._hooks[event].append(callback)
+        _register_hook(self._hooks, event, callback)
+        self._has_handlers = True
 
-    def _validate_parameters(self, kwargs: Dict[str, Any]) -> None:
+    def __setattr__(self, name: str, value: Any) -> None:
         """
-        Validates that the provided parameters match the expected parameters.
-        
-        Args:
-            kwargs: Dictionary of parameters to validate
-            
-        Raises:
-            ValueError: If unexpected or missing required parameters are found
-            TypeError: If parameter types don't match expected types
+        Rebuilds the tool's validator when its parameters are reassigned.
+        Changes made to the parameters dict in place are not picked up, so
+        assign a new dict to change a tool's parameters.
         """
-        if not kwargs:
-            return
-            
-        # check for unexpected parameters 
-        unexpected_params = set(kwargs.keys()) - set(self.parameters.keys())
-        if unexpected_params:
-            raise ValueError(f"Unexpected parameters: {unexpected_params}")
-        
-        # define mapping of type strings to actual types
-        type_map = {
-            "str": str,
-            "int": int,
-            "float": float,
-            "bool": bool,
-            "list": list,
-            "dict": dict,
-            "tuple": tuple,
-            "set": set
-        }
-        
-        # check required parameters and types
-        for param_name, param_spec in self.parameters.items():
-            if param_spec.required and param_name not in kwargs:
-                if param_spec.default is None:
-                    raise ValueError(f"Missing required parameter: {param_name}")
-                kwargs[param_name] = param_spec.default
-            
-            # if parameter is provided, validate its type
-            if param_name in kwargs:
-                param_value = kwargs[param_name]
-                
-                # Handle None for optional parameters
-                if param_value is None:
-                    if param_spec.required:
-                        raise TypeError(
-                            f"Parameter '{param_name}' must be of type {param_spec.type}, "
-                            f"got NoneType"
-                        )
-                    # For optional parameters, set to default if None
-                    kwargs[param_name] = param_spec.default
-                    continue
-                
-                type_str = param_spec.type.lower()
-                if type_str not in type_map:
-                    raise ValueError(f"Unsupported parameter type: {param_spec.type}")
-                expected_type = type_map[type_str]
-                if not isinstance(param_value, expected_type):
-                    raise TypeError(
-                        f"Parameter '{param_name}' must be of type {param_spec.type}, "
-                        f"got {type(param_value).__name__}"
-                    )
-
-    def __getattribute__(self, name: str) -> Any:
-        """
-        Intercepts method calls to handle event triggering.
-        """
-        attr = super().__getattribute__(name)
-        
-        if not hasattr(attr, '__call__') or name not in ['invoke', 'ainvoke']:
-            return attr
-        
-        events = {
-            'before': {
-                'invoke': ToolEvent.BEFORE_INVOKE,
-                'ainvoke': ToolEvent.BEFORE_AINVOKE
-            },
-            'after': {
-                'invoke': ToolEvent.AFTER_INVOKE,
-                'ainvoke': ToolEvent.AFTER_AINVOKE
-            },
+        super().__setattr__(name, value)
+        if name == "parameters":
+            self.__pydantic_private__["_validator"] = _get_validator(self.parameters)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """
+        Drops the generated validator and the toolbox weak references from
+        the pickled state, since neither can be pickled.
+        """
+        state = super().__getstate__()
+        state["__pydantic_private__"] = {
+            name: value for name, value in state["__pydantic_private__"].items()
+            if name not in ("_validator", "_toolboxes")
         }
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """
+        Restores a pickled tool, rebuilding its validator. The tool no longer
+        belongs to any toolbox, so only its own hooks are kept.
+        """
+        super().__setstate__(state)
+        private = self.__pydantic_private__
+        private.update(
+            _toolboxes=(),
+            _has_handlers=any(private["_hooks"].values()),
+            _validator=_get_validator(self.parameters),
+        )
+
+    def _add_toolbox(self, toolbox: "BaseToolbox") -> None:
+        """
+        Adds a toolbox whose callbacks the tool triggers after its own.
+        A tool defined as a toolbox class attribute belongs to every
+        instance of that class, so toolboxes are referenced weakly and the
+        references of collected ones are dropped here.
+
+        Args:
+            toolbox: The toolbox the tool is added to
+        """
+        self._toolboxes = tuple(
+            toolbox_ref for toolbox_ref in self._toolboxes
+            if toolbox_ref() is not None and toolbox_ref() is not toolbox
+        ) + (weakref.ref(toolbox),)
+        if any(toolbox._hooks.values()):
+            self._has_handlers = True
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        """
+        Wraps the invoke and ainvoke methods defined by a tool subclass
+        so that they trigger the tool lifecycle events. The wrappers are
+        built once per class rather than on every attribute access.
+        Also compiles the subclass's kernel if it opted into jit.
+        """
+        super().__init_subclass__(**kwargs)
+        if 'invoke' in cls.__dict__:
+            cls.invoke = _wrap_invoke(cls.__dict__['invoke'])
+        if 'ainvoke' in cls.__dict__:
+            cls.ainvoke = _wrap_ainvoke(cls.__dict__['ainvoke'])
+
+        kernel = cls.__dict__.get('kernel')
+        if cls.jit and isinstance(kernel, staticmethod):
+            # numba is imported only once a tool opts into jit, since
+            # importing it is slow and most tools never need it
+            try:
+                from numba import njit
+            except ImportError:  # numba is optional, the kernel runs as plain Python
+                return
+            if cls.jit_signature is not None:
+                compiled = njit(cls.jit_signature, cache=True)(kernel.__func__)
+            else:
+                compiled = njit(cache=True)(kernel.__func__)
+            cls.kernel = staticmethod(compiled)
+
+    def _trigger_event_async(
+        self,
+        event: ToolEvent,
+        payload: Dict[str, Any]
+    ) -> Optional[Awaitable[None]]:
+        """
+        Triggers all callbacks registered for a specific event on the async
+        path. Synchronous callbacks run immediately, in order, and coroutine
+        callbacks then run concurrently once the returned awaitable is awaited.
+        When no callback needs awaiting, None is returned, so the caller
+        doesn't create and await a coroutine for nothing.
 
-        if name == 'invoke':
-            def wrapped(*args, **kwargs):
-                # Synchronous event triggering for invoke
-                for callback in self._hooks[events['before'][name]]:
-                    callback(self, args=args, kwargs=kwargs)
-                
-                try:
-                    self._validate_parameters(kwargs)
-                    result = attr(*args, **kwargs)
-                    
-                    for callback in self._hooks[events['after'][name]]:
-                        callback(self, result=result, args=args, kwargs=kwargs)
-                    
-                    return result
-                except Exception as e:
-                    for callback in self._hooks[ToolEvent.ERROR]:
-                        callback(self, error=e, args=args, kwargs=kwargs)
-                    raise
-            return wrapped
-        else:  # name == 'ainvoke'
-            async def awrapped(*args, **kwargs):
-                await self._trigger_event_async(
-                    events['before'][name],
-                    args=args,
-                    kwargs=kwargs
-                )
-                try:
-                    self._validate_parameters(kwargs)
-                    result = await attr(*args, **kwargs)
-                    
-                    await self._trigger_event_async(
-                        events['after'][name],
-                        result=result,
-                        args=args,
-                        kwargs=kwargs
-                    )
-                    return result
-                except Exception as e:
-                    await self._trigger_event_async(
-                        ToolEvent.ERROR,
-                        error=e,
-                        args=args,
-                        kwargs=kwargs
-                    )
-                    raise
-            return awrapped
-
-    async def _trigger_event_async(self, event: ToolEvent, **kwargs) -> None:
-        """
-        Triggers all callbacks registered for a specific event asynchronously.
+        The payload is passed along as one dict, and only expanded into
+        keyword arguments when a callback is called.
 
         Args:
             event: The event to trigger
-            **kwargs: Arguments to pass to the callback functions
+            payload: Keyword arguments to pass to the callback functions
+
+        Returns:
+            An awaitable for the pending coroutine callbacks, or None.
         """
-        for callback in self._hooks[event]:
+        coroutines = []
+        for callback, is_coroutine in _event_callbacks(self.__pydantic_private__, event):
             try:
-                if asyncio.iscoroutinefunction(callback):
-                    await callback(self, **kwargs)
+                if is_coroutine:
+                    coroutines.append(callback(self, **payload))
                 else:
-                    callback(self, **kwargs)
+                    callback(self, **payload)
+            except Exception as e:
+                pending = self._handle_callback_error(event, e, payload)
+                if pending is not None:
+                    coroutines.append(pending)
+
+        if not coroutines:
+            return None
+        return self._await_callbacks(event, coroutines, payload)
+
+    async def _await_callbacks(
+        self,
+        event: ToolEvent,
+        coroutines: List[Awaitable[None]],
+        payload: Dict[str, Any]
+    ) -> None:
+        """
+        Awaits the coroutine callbacks triggered for an event concurrently,
+        forwarding any errors they raise to the error event.
+
+        Args:
+            event: The event the callbacks were triggered for
+            coroutines: The coroutines returned by the callbacks
+            payload: Arguments that were passed to the callbacks
+        """
+        if len(coroutines) == 1:
+            results = [None]
+            try:
+                await coroutines[0]
             except Exception as e:
-                logging.error(f"Error in async {event} callback: {str(e)}")
-                if event != ToolEvent.ERROR:
-                    await self._trigger_event_async(
-                        ToolEvent.ERROR,
-                        error=e,
-                        source_event=event,
-                        **kwargs
-                    )
+                results = [e]
+        else:
+            results = await asyncio.gather(*coroutines, return_exceptions=True)
+
+        for result in results:
+            if isinstance(result, Exception):
+                pending = self._handle_callback_error(event, result, payload)
+                if pending is not None:
+                    await pending
+            elif isinstance(result, BaseException):
+                raise result
+
+    def _handle_callback_error(
+        self,
+        event: ToolEvent,
+        error: Exception,
+        payload: Dict[str, Any]
+    ) -> Optional[Awaitable[None]]:
+        """
+        Logs an error raised by an event callback and forwards it to the
+        error event, unless it was raised by an error callback itself.
+
+        Args:
+            event: The event whose callback raised the error
+            error: The error raised by the callback
+            payload: Arguments that were passed to the callback
+
+        Returns:
+            An awaitable for pending error callbacks, or None.
+        """
+        logging.error(f"Error in async {event} callback: {str(error)}")
+        if event is not ToolEvent.ERROR:
+            return self._trigger_event_async(
+                ToolEvent.ERROR,
+                {"error": error, "source_event": event, **payload}
+            )
+        return None
+
+    @staticmethod
+    def run_async(coro: Awaitable[_T]) -> _T:
+        """
+        Runs a coroutine, such as a call to ainvoke, to completion from
+        synchronous code. Uses uvloop's faster event loop when installed.
+
+        Args:
+            coro: The coroutine to run
+
+        Returns:
+            The coroutine's result.
+        """
+        if uvloop is not None:
+            return uvloop.run(coro)
+        return asyncio.run(coro)
 
     @abstractmethod
     def invoke(self, *args, **kwargs):
@@ -390,10 +894,29 @@ class BaseTool(ToolMetadata, ABC):
         Formats the tool's metadata into the OpenAI function calling format.
         This allows the tool to be used with OpenAI's function calling API.
 
+        The result is cached until the tool's name, description or parameters
+        are reassigned. Callers get a copy, so modifying it doesn't change
+        the cached format.
+
         Returns:
             dict: A dictionary containing the tool's metadata in OpenAI's format.
         """
-        return {
+        return _copy_openai_tool(self._openai_tool())
+
+    def _openai_tool(self) -> Dict[str, Any]:
+        """
+        Returns the tool's metadata in OpenAI's function calling format,
+        rebuilding the cached format if it was built from other metadata.
+        """
+        private = self.__pydantic_private__
+        key = (self.name, self.description, self.parameters)
+        cached = private["_openai_cache"]
+        # tuple comparison checks identity first, so an unchanged tool
+        # doesn't compare its parameters item by item
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        openai_tool = {
             "type": "function",
             "function": {
                 "name": self.name,
@@ -404,6 +927,12 @@ class BaseTool(ToolMetadata, ABC):
                 },
             },
         }
+        private["_openai_cache"] = (key, openai_tool)
+        return openai_tool
+
+
+# the default ainvoke is inherited rather than defined by tool subclasses
+BaseTool.ainvoke = _wrap_ainvoke(BaseTool.ainvoke)
 
 
 class BaseToolbox(ABC):
@@ -414,26 +943,84 @@ class BaseToolbox(ABC):
     Attributes:
         context: A dictionary to store any contextual information shared across tools.
     """
+    _class_tools: Dict[str, BaseTool] = {}
+    _class_tool_list: Tuple[BaseTool, ...] = ()
+    _class_openai_tools: Tuple[Dict[str, Any], ...] = ()
+
     def __init__(self, *args, **kwargs) -> None:
         """
         Initializes a new toolbox instance with context from kwargs.
         The context can be used to share state or configuration across multiple tools.
         """
+        self._tools: Dict[str, BaseTool] = {}
+        self._tool_list: Tuple[BaseTool, ...] = self._class_tool_list
+        self._openai_tools: Optional[Tuple[Dict[str, Any], ...]] = self._class_openai_tools
+        self._hooks: Dict[ToolEvent, _Callbacks] = {
+            event: () for event in ToolEvent
+        }
         self.context = kwargs.get('context', {})
         self._inject_context_to_tools()
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        """
+        Registers the tools defined as class attributes of the toolbox
+        (including inherited ones), so that instances don't need to look
+        up their attributes to discover them. Their OpenAI format is
+        rendered here too, since it is the same for every instance.
+        """
+        super().__init_subclass__(**kwargs)
+        names = dict.fromkeys(
+            name for klass in reversed(cls.__mro__) for name in vars(klass)
+        )
+        cls._class_tools = {
+            name: tool for name, tool in (
+                (name, getattr(cls, name, None)) for name in names
+            )
+            if isinstance(tool, BaseTool)
+        }
+        cls._class_tool_list = tuple(cls._class_tools.values())
+        cls._class_openai_tools = tuple(
+            tool.as_openai_tool() for tool in cls._class_tool_list
+        )
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """
+        Registers tools that are added to the toolbox after initialization.
+        """
+        super().__setattr__(name, value)
+        if isinstance(value, BaseTool) and hasattr(self, '_tools'):
+            value.context._shared_context = self.context
+            value._add_toolbox(self)
+            self._tools[name] = value
+            self._tool_list = tuple(self._tools.values())
+            self._openai_tools = None
     
     def _inject_context_to_tools(self) -> None:
         """
-        Injects the toolbox's context into all tools managed by this toolbox.
-        All tools share the same context reference to allow state sharing.
+        Collects the toolbox's tools and injects the toolbox's context and
+        event hooks into each of them in a single pass. All tools share the
+        same context reference to allow state sharing.
+
+        Tools assigned to the instance before BaseToolbox.__init__ ran, such
+        as by a subclass's __init__, are collected too, overriding class
+        tools of the same name.
         """
-        for tool in self.get_tools():
-            # Share the same context reference across all tools
+        instance_tools = {
+            name: value for name, value in vars(self).items()
+            if isinstance(value, BaseTool)
+        }
+        for name, tool in {**self._class_tools, **instance_tools}.items():
+            # Share the same context and hooks references across all tools
             tool.context._shared_context = self.context
+            tool._add_toolbox(self)
+            self._tools[name] = tool
+        if instance_tools:
+            self._tool_list = tuple(self._tools.values())
+            self._openai_tools = None
     
     def get_tools(self) -> List[BaseTool]:
         """
-        Discovers all tool instances that are defined as class attributes
+        Returns all tool instances that are defined as class attributes
         of the toolbox. This allows toolboxes to define their tools as
         class attributes and have them automatically collected.
 
@@ -443,34 +1030,36 @@ class BaseToolbox(ABC):
                 bing_search = BingSearchTool()
 
         Returns:
-            List[BaseTool]: A list of all tool instances defined in the toolbox.
-        """
-        tools = []
-        for attr_name in dir(self):
-            attr = getattr(self, attr_name)
-            if isinstance(attr, BaseTool):
-                tools.append(attr)
-        return tools
+            List[BaseTool]: All tool instances defined in the toolbox.
+        """
+        return list(self._tool_list)
     
     def on(self, event: Union[ToolEvent, ToolEventType], callback: Callable) -> None:
         """
         Registers a callback function for a specific event on all tools.
+        The callback is stored once on the toolbox, and every tool triggers
+        the toolbox's callbacks, including tools added later.
         """
-        if isinstance(event, str):
-            event = ToolEvent(event)
-        
-        for tool in self.get_tools():
-            tool.on(event, callback)
+        _register_hook(self._hooks, event, callback)
+        for tool in self._tool_list:
+            tool._has_handlers = True
     
     def as_openai_tools(self) -> List[Dict[str, Any]]:
         """
         Formats all tools in the toolbox into OpenAI's function calling format.
 
+        The formats are rendered once per toolbox class and shared by its
+        instances, so callers get copies that are safe to modify.
+
         Returns:
             List[Dict[str, Any]]: A list of dictionaries containing each tool's
             metadata in OpenAI's format.
         """
-        return [tool.as_openai_tool() for tool in self.get_tools()]
+        if self._openai_tools is None:
+            self._openai_tools = tuple(
+                tool.as_openai_tool() for tool in self._tool_list
+            )
+        return [_copy_openai_tool(openai_tool) for openai_tool in self._openai_tools]
     
     @classmethod
     def from_tools(cls, tools: List[BaseTool], context: Optional[Dict[str, Any]] = None, **kwargs) -> "BaseToolbox":
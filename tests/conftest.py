@@ -1,8 +1,32 @@
+import asyncio
 import pytest
+import pytest_asyncio.plugin
 from llmrepo.tools import BaseTool, ToolParameter
 
 pytest_plugins = ("pytest_asyncio",)
 
+try:
+    import uvloop
+except ImportError:  # async tests run on asyncio's own event loop instead
+    uvloop = None
+
+# run async tests on uvloop when it is installed, through the loop factory
+# hook where pytest-asyncio has it and the (since deprecated) event loop
+# policy fixture otherwise
+_asyncio_specs = getattr(pytest_asyncio.plugin, "PytestAsyncioSpecs", None)
+if hasattr(_asyncio_specs, "pytest_asyncio_loop_factories"):
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_asyncio_loop_factories(config, item):
+        if uvloop is None:
+            return {"asyncio": asyncio.new_event_loop}
+        return {"uvloop": uvloop.new_event_loop}
+else:
+    @pytest.fixture(scope="session")
+    def event_loop_policy():
+        if uvloop is None:
+            return asyncio.get_event_loop_policy()
+        return uvloop.EventLoopPolicy()
+
 @pytest.fixture
 def simple_tool():
     class SimpleTool(BaseTool):
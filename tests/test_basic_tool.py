@@ -1,3 +1,4 @@
+import pickle
 import pytest
 from llmrepo.tools import BaseTool, ToolParameter
 
@@ -36,6 +37,38 @@ def test_tool_default_parameters():
     result = tool.invoke(text="hello")
     assert result == "hello"
 
+def test_tool_openai_format_is_copied():
+    tool = SimpleTool()
+    openai_tool = tool.as_openai_tool()
+    openai_tool["strict"] = True
+    openai_tool["function"]["parameters"]["text"]["type"] = "string"
+
+    fresh = tool.as_openai_tool()
+    assert "strict" not in fresh
+    assert fresh["function"]["parameters"]["text"]["type"] == "str"
+
+def test_tool_openai_format_follows_metadata():
+    tool = SimpleTool()
+    assert tool.as_openai_tool()["function"]["name"] == "simple_tool"
+
+    renamed = tool.model_copy(update={"name": "renamed"})
+    assert renamed.as_openai_tool()["function"]["name"] == "renamed"
+    assert tool.as_openai_tool()["function"]["name"] == "simple_tool"
+
+    tool.description = "Changed"
+    assert tool.as_openai_tool()["function"]["description"] == "Changed"
+
+def test_tool_pickle_round_trip():
+    tool = SimpleTool()
+    tool.context["greeting"] = "hi"
+
+    restored = pickle.loads(pickle.dumps(tool))
+    assert restored.name == "simple_tool"
+    assert restored.context.get("greeting") == "hi"
+    assert restored.invoke(text="ab") == "ab"
+    with pytest.raises(TypeError):
+        restored.invoke(text="ab", count="2")
+
 def test_tool_parameter_validation():
     tool = SimpleTool()
     
@@ -49,4 +82,36 @@ def test_tool_parameter_validation():
     
     # Test unexpected parameter
     with pytest.raises(ValueError, match="Unexpected parameters"):
-        tool.invoke(text="hello", invalid_param=True) 
\ No newline at end of file
+        tool.invoke(text="hello", invalid_param=True)
+
+
+def test_tool_jit_kernel():
+    dispatcher = pytest.importorskip("numba.core.registry").CPUDispatcher
+
+    class SquareTool(BaseTool):
+        jit = True
+        jit_signature = "int64(int64)"
+
+        @staticmethod
+        def kernel(n):
+            return n * n
+
+        def invoke(self, n: int) -> int:
+            return self.kernel(n)
+
+    tool = SquareTool(
+        name="square",
+        description="Squares a number",
+        parameters={
+            "n": ToolParameter(
+                name="n",
+                type="int",
+                description="Number to square",
+                required=True
+            )
+        }
+    )
+    assert isinstance(SquareTool.kernel, dispatcher)
+    assert SquareTool.kernel.signatures
+    assert tool.invoke(n=12) == 144
+    assert "jit" not in SquareTool.model_fields
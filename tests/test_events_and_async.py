@@ -78,4 +78,86 @@ async def test_async_event_handlers():
     await tool.ainvoke(delay=0.1)
     assert len(events_triggered) == 2
     assert events_triggered[0][0] == "before"
-    assert events_triggered[1][0] == "after" 
\ No newline at end of file
+    assert events_triggered[1][0] == "after"
+
+
+def test_event_handlers_with_super_invoke():
+    class PrefixedTool(AsyncTool):
+        def invoke(self, delay: float) -> str:
+            return "Prefixed " + super().invoke(delay=delay)
+
+    tool = PrefixedTool()
+    events_triggered = []
+    tool.on(ToolEvent.BEFORE_INVOKE, lambda tool, **kwargs: events_triggered.append("before"))
+    tool.on(ToolEvent.AFTER_INVOKE, lambda tool, result, **kwargs: events_triggered.append("after"))
+
+    assert tool.invoke(delay=0.1) == "Prefixed Sync waited 0.1s"
+    assert events_triggered == ["before", "after"]
+
+def test_event_handlers_are_per_tool():
+    tool = AsyncTool()
+    other_tool = AsyncTool()
+    events_triggered = []
+    tool.on(ToolEvent.BEFORE_INVOKE, lambda tool, **kwargs: events_triggered.append("before"))
+
+    other_tool.invoke(delay=0.1)
+    assert events_triggered == []
+
+    tool.invoke(delay=0.1)
+    assert events_triggered == ["before"]
+
+@pytest.mark.asyncio
+async def test_async_event_handlers_run_concurrently():
+    tool = AsyncTool()
+    started = []
+    errors = []
+
+    async def slow_handler(tool, **kwargs):
+        started.append("slow")
+        await asyncio.sleep(0.1)
+
+    async def failing_handler(tool, **kwargs):
+        started.append("failing")
+        raise RuntimeError("handler failed")
+
+    tool.on(ToolEvent.AFTER_AINVOKE, slow_handler)
+    tool.on(ToolEvent.AFTER_AINVOKE, slow_handler)
+    tool.on(ToolEvent.AFTER_AINVOKE, failing_handler)
+    tool.on(ToolEvent.ERROR, lambda tool, error, **kwargs: errors.append(str(error)))
+
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    result = await tool.ainvoke(delay=0.0)
+    elapsed = loop.time() - start
+
+    assert result == "Async waited 0.0s"
+    assert started == ["slow", "slow", "failing"]
+    assert errors == ["handler failed"]
+    assert elapsed < 0.2
+
+def test_run_async():
+    tool = AsyncTool()
+    assert tool.run_async(tool.ainvoke(delay=0.1)) == "Async waited 0.1s"
+
+@pytest.mark.asyncio
+async def test_sync_handlers_on_async_events():
+    tool = AsyncTool()
+    events_triggered = []
+
+    def failing_before(tool, **kwargs):
+        events_triggered.append("before")
+        raise RuntimeError("handler failed")
+
+    async def async_error(tool, error, source_event, **kwargs):
+        events_triggered.append(("error", source_event, str(error)))
+
+    tool.on(ToolEvent.BEFORE_AINVOKE, failing_before)
+    tool.on(ToolEvent.AFTER_AINVOKE, lambda tool, result, **kwargs: events_triggered.append("after"))
+    tool.on(ToolEvent.ERROR, async_error)
+
+    assert await tool.ainvoke(delay=0.0) == "Async waited 0.0s"
+    assert events_triggered == [
+        "before",
+        ("error", ToolEvent.BEFORE_AINVOKE, "handler failed"),
+        "after",
+    ]
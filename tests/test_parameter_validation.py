@@ -54,7 +54,7 @@ class ValidationTool(BaseTool):
             "list": list_param or []
         }
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def validation_tool():
     return ValidationTool()
 
@@ -158,4 +158,136 @@ def test_type_coercion(validation_tool):
     
     # String representations should not be coerced
     with pytest.raises(TypeError, match="must be of type int"):
-        validation_tool.invoke(string_param="test", float_param=1.0, int_param="42") 
\ No newline at end of file
+        validation_tool.invoke(string_param="test", float_param=1.0, int_param="42")
+
+    # Booleans should not be accepted as integers
+    with pytest.raises(TypeError, match="must be of type int"):
+        validation_tool.invoke(string_param="test", float_param=1.0, int_param=True)
+
+def test_validator_shared_between_tools():
+    """Test that tools with the same parameter schema share a validator"""
+    class EchoTool(BaseTool):
+        def invoke(self, text: str) -> str:
+            return text
+
+    def make_tool():
+        return EchoTool(
+            name="echo",
+            description="Echoes its input",
+            parameters={
+                "text": ToolParameter(
+                    name="text",
+                    type="str",
+                    description="Text to echo",
+                    required=True
+                )
+            }
+        )
+
+    assert make_tool()._validator.func is make_tool()._validator.func
+
+def test_equal_defaults_of_different_types_not_shared():
+    """Test that tools sharing a validator still get their own defaults"""
+    class ValuesTool(BaseTool):
+        def invoke(self, values: list) -> list:
+            return values
+
+    def make_tool(default):
+        return ValuesTool(
+            name="values",
+            description="Returns its values",
+            parameters={
+                "values": ToolParameter(
+                    name="values",
+                    type="list",
+                    description="Values to return",
+                    required=False,
+                    default=default
+                )
+            }
+        )
+
+    ints, floats, bools = make_tool([1, 0]), make_tool([1.0, 0.0]), make_tool([True, False])
+    assert ints._validator.func is floats._validator.func is bools._validator.func
+
+    for tool, expected in ((ints, [1, 0]), (floats, [1.0, 0.0]), (bools, [True, False])):
+        result = tool.invoke(values=None)
+        assert result == expected
+        assert [type(value) for value in result] == [type(value) for value in expected]
+
+def test_list_default_not_shared_between_calls():
+    """Test that each call gets its own copy of a list default"""
+    class AppendTool(BaseTool):
+        def invoke(self, items: list) -> list:
+            items.append(1)
+            return items
+
+    tool = AppendTool(
+        name="append",
+        description="Appends 1 to a list",
+        parameters={
+            "items": ToolParameter(
+                name="items",
+                type="list",
+                description="Items to append to",
+                required=False,
+                default=[]
+            )
+        }
+    )
+
+    assert tool.invoke(items=None) == [1]
+    assert tool.invoke(items=None) == [1]
+
+def test_default_keeps_the_given_value():
+    """Test that mutable defaults are passed and shown as given"""
+    class OptionsTool(BaseTool):
+        def invoke(self, tags, options: dict) -> tuple:
+            return tags, options
+
+    tool = OptionsTool(
+        name="options",
+        description="Returns its options",
+        parameters={
+            "tags": ToolParameter(
+                name="tags",
+                type="any",
+                description="Tags of any type",
+                required=False,
+                default=["a"]
+            ),
+            "options": ToolParameter(
+                name="options",
+                type="dict",
+                description="Options to return",
+                required=False,
+                default={"retries": 1}
+            )
+        }
+    )
+
+    assert tool.parameters["tags"].default == ["a"]
+    assert tool.as_openai_tool()["function"]["parameters"]["tags"]["default"] == ["a"]
+    assert tool.invoke(tags=None, options=None) == (["a"], {"retries": 1})
+
+def test_validator_rebuilt_when_parameters_reassigned():
+    """Test that assigning new parameters updates the validation"""
+    class KwargsTool(BaseTool):
+        def invoke(self, **kwargs) -> dict:
+            return kwargs
+
+    tool = KwargsTool(name="kwargs", description="Returns its kwargs")
+    with pytest.raises(ValueError, match="Unexpected parameters"):
+        tool.invoke(count=1)
+
+    tool.parameters = {
+        "count": ToolParameter(
+            name="count",
+            type="int",
+            description="A count",
+            required=False
+        )
+    }
+    assert tool.invoke(count=1) == {"count": 1}
+    with pytest.raises(TypeError):
+        tool.invoke(count="1")
@@ -33,13 +33,21 @@ class CounterTool(BaseTool):
         self.context["count"] = count
         return count
 
-@pytest.fixture
-def test_toolbox():
+@pytest.fixture(scope="module")
+def test_toolbox_class():
     class TestToolbox(BaseToolbox):
         greet = GreetingTool()
         counter = CounterTool()
-    
-    return TestToolbox(context={"language": "es"})
+
+    return TestToolbox
+
+@pytest.fixture
+def test_toolbox(test_toolbox_class):
+    toolbox = test_toolbox_class(context={"language": "es"})
+    yield toolbox
+    # the tools are shared by every instance of the toolbox class,
+    # so reset the count the counter keeps in its own context
+    toolbox.counter.context._internal_context.clear()
 
 def test_toolbox_context_sharing(test_toolbox):
     # Test shared context
@@ -59,10 +67,98 @@ def test_toolbox_tool_discovery(test_toolbox):
     assert any(t.name == "greet" for t in tools)
     assert any(t.name == "counter" for t in tools)
 
+def test_toolbox_get_tools_returns_new_list(test_toolbox):
+    tools = test_toolbox.get_tools()
+    assert isinstance(tools, list)
+
+    tools.append(GreetingTool())
+    assert len(test_toolbox.get_tools()) == 2
+
 def test_openai_format(test_toolbox):
     tools = test_toolbox.as_openai_tools()
     
     assert len(tools) == 2
     assert all(tool["type"] == "function" for tool in tools)
     assert any(tool["function"]["name"] == "greet" for tool in tools)
-    assert any(tool["function"]["name"] == "counter" for tool in tools) 
\ No newline at end of file
+    assert any(tool["function"]["name"] == "counter" for tool in tools)
+
+
+def test_toolbox_tool_added_dynamically(test_toolbox):
+    assert len(test_toolbox.get_tools()) == 2
+
+    test_toolbox.extra = GreetingTool()
+    tools = test_toolbox.get_tools()
+    assert len(tools) == 3
+    assert any(t is test_toolbox.extra for t in tools)
+
+def test_toolbox_inherits_tools():
+    class BaseGreetingToolbox(BaseToolbox):
+        greet = GreetingTool()
+
+    class ExtendedToolbox(BaseGreetingToolbox):
+        counter = CounterTool()
+
+    toolbox = ExtendedToolbox(context={"language": "es"})
+    assert [t.name for t in toolbox.get_tools()] == ["greet", "counter"]
+    assert toolbox.greet.invoke(name="Bob") == "Hola Bob!"
+
+def test_toolbox_tool_assigned_before_init():
+    events_triggered = []
+
+    class InitToolbox(BaseToolbox):
+        greet = GreetingTool()
+
+        def __init__(self, **kwargs):
+            self.greet = GreetingTool()
+            self.counter = CounterTool()
+            super().__init__(**kwargs)
+
+    toolbox = InitToolbox(context={"language": "es"})
+    toolbox.on("invoke:after", lambda tool, result, **kwargs: events_triggered.append(result))
+
+    tools = toolbox.get_tools()
+    assert [t.name for t in tools] == ["greet", "counter"]
+    assert tools[0] is toolbox.greet and tools[0] is not InitToolbox.greet
+    assert len(toolbox.as_openai_tools()) == 2
+    assert toolbox.greet.invoke(name="Bob") == "Hola Bob!"
+    assert events_triggered == ["Hola Bob!"]
+
+def test_toolbox_event_handlers(test_toolbox):
+    events_triggered = []
+    test_toolbox.on("invoke:after", lambda tool, result, **kwargs: events_triggered.append((tool.name, result)))
+
+    test_toolbox.greet.invoke(name="Alice")
+    test_toolbox.extra = GreetingTool()
+    test_toolbox.extra.invoke(name="Bob")
+
+    assert events_triggered == [("greet", "Hola Alice!"), ("greet", "Hola Bob!")]
+
+def test_toolbox_event_handlers_per_instance(test_toolbox_class):
+    first_events, second_events = [], []
+    first = test_toolbox_class(context={"language": "es"})
+    first.on("invoke:after", lambda tool, result, **kwargs: first_events.append(result))
+    second = test_toolbox_class(context={"language": "es"})
+    second.on("invoke:after", lambda tool, result, **kwargs: second_events.append(result))
+
+    first.greet.invoke(name="Alice")
+
+    # both toolboxes share the class's tools, so each sees the invocation
+    assert first_events == ["Hola Alice!"]
+    assert second_events == ["Hola Alice!"]
+
+    del second
+    first.greet.invoke(name="Bob")
+    assert first_events == ["Hola Alice!", "Hola Bob!"]
+    assert second_events == ["Hola Alice!"]
+
+def test_openai_format_is_copied(test_toolbox_class):
+    tools = test_toolbox_class().as_openai_tools()
+    tools[0]["function"]["description"] = "Changed"
+
+    assert test_toolbox_class().as_openai_tools()[0]["function"]["description"] == "Greets a user"
+
+def test_openai_format_with_tool_added_dynamically(test_toolbox):
+    assert len(test_toolbox.as_openai_tools()) == 2
+
+    test_toolbox.extra = GreetingTool()
+    assert len(test_toolbox.as_openai_tools()) == 3